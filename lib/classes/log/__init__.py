@@ -25,7 +25,7 @@ USAGE:
  - if in importable module (e.g. class or utility module), include code below
    immediately after module docstring:
         import logging
-        log = logging.getLogger().getChild('fully_qualified_module_import_path') # e.g. lib.classes.log
+        log = logging.getLogger(__name__) # i.e. fully qualified module import path; e.g. lib.classes.log
 
 
 EXAMPLE MODULE #1:
@@ -63,9 +63,9 @@ EXAMPLE MODULE #2:
     """ Example importable module (e.g. class or utility module) for Log class use. """
     # NOTE: log initialized in top-level environment module importing this
     # class or utility module will connect to log initialized below, labeling
-    # this modules' log entries with specified fully_qualified_module_import_path
+    # this modules' log entries with its fully qualified module import path (__name__)
     import logging
-    log = logging.getLogger().getChild('fully_qualified_module_import_path') # e.g. lib.classes.log
+    log = logging.getLogger(__name__) # i.e. fully qualified module import path; e.g. lib.classes.log
     
     [ … other imports and definitions … ]
 
@@ -85,36 +85,66 @@ REFERENCES:
               - .handlers — handlers -- https://docs.python.org/3/library/logging.handlers.html
 '''
 import logging # https://docs.python.org/3/library/logging.html
-log = logging.getLogger().getChild('lib.classes.log')
+log = logging.getLogger(__name__)
 
 from dataclasses import dataclass, field # https://docs.python.org/3/library/dataclasses.html
 
+import atexit # https://docs.python.org/3/library/atexit.html
+import concurrent.futures # https://docs.python.org/3/library/concurrent.futures.html
 import datetime # https://docs.python.org/3/library/datetime.html
+import logging.handlers # https://docs.python.org/3/library/logging.handlers.html
 import os # https://docs.python.org/3/library/os.html
-import shutil
+import queue # https://docs.python.org/3/library/queue.html
+import sys # https://docs.python.org/3/library/sys.html
 
 from lib.classes.log.exec_info import _ExecInfo
 
 from lib.classes.log.exception_message import ExceptionMessageFormatted
+from lib.classes.log.formatters import CachedTimeFormatter, LevelFormatter
+from lib.classes.log.handlers import BatchedStderrHandler, BufferedFileHandler
 import lib.classes.log.variable_value_message
 
 
-@dataclass
+# Contextual color character flags by log record level.
+_CNTXT_FLAGS = {
+    logging.DEBUG: '⚪',
+    logging.INFO: '⬛',
+    logging.WARNING: '🟧',
+    logging.ERROR: '🟥',
+    logging.CRITICAL: '🟥🟥',
+}
+
+
+def _report_copy_error(copy_future: concurrent.futures.Future) -> None:
+    ''' Log error, if background log file copy failed, even if caller never checks result. '''
+    if copy_future.exception() is not None:
+        log.error(f'LOG FILE COPY FAILED: {copy_future.exception()!r}')
+
+
+
+@dataclass(slots=True)
 class Log:
     ''' General log class. '''
     _module_filepathname: str
     _exec_info: _ExecInfo = field(default_factory=_ExecInfo)
     _log: logging.Logger = None
+    _queue_handler: logging.handlers.QueueHandler = None
+    _listener: logging.handlers.QueueListener = None
 
 
 
     def __post_init__(self):
         ''' Clean-up dataclass initialization. '''
         self._exec_info.set_info(self._module_filepathname)
-        # Check if initial logs directory exists, create if not.
+        # Create initial logs directory, if missing.
         logs_dirpathname = os.path.join(self._exec_info._directories.initial, 'logs')
-        if not os.path.exists(logs_dirpathname):
+        try:
             os.mkdir(logs_dirpathname)
+            created = True
+        except FileExistsError:
+            created = False
+
+        if created:
             self.initialize()
             msg = ExceptionMessageFormatted()
             msg.title = 'LOGS DIRECTORY CREATED'
@@ -140,9 +170,9 @@ class Log:
         ''' Return log header. '''
         return (
              'BEGIN LOGGING...\n'
-            f'START: {self._exec_info._timestamps.start.isoformat()}\n'
+            f'START: {self._exec_info._timestamps._start_iso}\n'
             f'USER: {self._exec_info._user}\n'
-            f'OPERATING SYSTEM: {self._exec_info._system}\n'
+            f'OPERATING SYSTEM: {self._exec_info._get_system()}\n'
             f'PYTHON VERSION:: {self._exec_info._python_version}\n'
             f'ROOT: {self._exec_info._get_module_filepathname()}\n'
             f'ARGUMENTS: {self._exec_info._arguments}\n'
@@ -174,23 +204,60 @@ class Log:
 
 
 
-    def terminate(self, dirpathname: str | None = None) -> None:
-        ''' Set end execution end time, add log footer, copy to final log directory, if provided.
+    def terminate(self, dirpathname: str | None = None) -> concurrent.futures.Future | None:
+        ''' Set end execution end time, add log footer, copy to final log directory (in background), if provided.
 
         INPUT:
         - dirpathname (str) = final log directory path and name; e.g. dirpathname\\module_name_timestamp.log)
+
+        OUTPUT:
+        - (Future | None) = background copy, if dirpathname provided; call result() to wait
+                            for copy and raise its exception, if any (e.g. FileNotFoundError)
         '''
-        self._exec_info._timestamps.end = datetime.datetime.now(datetime.UTC)
-        logfile_pathname = self._exec_info._get_filepathname()
+        self._exec_info._timestamps.set_end(datetime.datetime.now(datetime.UTC))
+        initial_logfile_pathname = self._exec_info._get_filepathname()
         self._exec_info._directories.final = dirpathname
-        self.info(self._get_footer())
+        self._exec_info._set_filepathnames()
+        logfile_pathname = self._exec_info._get_filepathname()
+        self.info(self._get_footer(logfile_pathname))
+        # Stop background listener, writing all queued records, then
+        # detach queue handler, and flush and close handlers before copying
+        # log file. Skip if already terminated.
+        if self._listener is not None:
+            self._listener.stop()
+            atexit.unregister(self._listener.stop)
+            self._log.removeHandler(self._queue_handler)
+            for handler in self._listener.handlers:
+                handler.close()
+            self._queue_handler = None
+            self._listener = None
         if dirpathname is not None:
-            shutil.copy(logfile_pathname, dirpathname)
+            import shutil # https://docs.python.org/3/library/shutil.html
+            # Copy in background thread, so terminate returns immediately.
+            # Interpreter waits for copy to complete before exiting.
+            try:
+                executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+                copy_future = executor.submit(shutil.copyfile, initial_logfile_pathname, logfile_pathname)
+            except RuntimeError: # Interpreter shutting down (e.g. called via atexit); copy synchronously.
+                shutil.copyfile(initial_logfile_pathname, logfile_pathname)
+                copy_future = concurrent.futures.Future()
+                copy_future.set_result(logfile_pathname)
+                return copy_future
 
+            copy_future.add_done_callback(_report_copy_error)
+            executor.shutdown(wait=False)
+            return copy_future
 
+        return None
 
-    def _get_footer(self) -> str:
-        ''' Return log footer. '''
+
+
+    def _get_footer(self, logfile_pathname: str) -> str:
+        ''' Return log footer.
+
+        INPUT:
+        - logfile_pathname (str) = final log file path and name
+        '''
         footer = (
              '========== ENDING ==========\n'
         )
@@ -202,10 +269,10 @@ class Log:
             
         footer += (
             '\n'
-            f'LOG: {self._exec_info._get_filepathname()}\n'
+            f'LOG: {logfile_pathname}\n'
              '\n'
-            f'  END: {self._exec_info._timestamps.end.isoformat()}\n'
-            f'- START: {self._exec_info._timestamps.start.isoformat()}\n'
+            f'  END: {self._exec_info._timestamps._end_iso}\n'
+            f'- START: {self._exec_info._timestamps._start_iso}\n'
             f'= ELAPSED: {self._exec_info._timestamps._get_elapsed()}'
         )
 
@@ -218,65 +285,34 @@ class Log:
         INPUT:
         - filepathname (str)(optional) = path and name of log file, if omitted stream to stderr
                                          (e.g. D:\\path\\name.log)
+
+        NOTE: If logging to file, alerts (e.g. warning, error, and critical) also
+        stream to stderr only if it is a terminal or FORCE_STDERR_LOG=1.
         '''
 
 
 
         # ---------- FILTERS ----------
         # Define filter functions
-        def filter_fyi(record: logging.LogRecord) -> bool:
-            ''' Filter to accept log records with level less than warning level, otherwise ignore.
-
-            OUTPUT:
-            - (bool) = true to accept, false to ignore
-            '''
-            return record.levelno < 30 # logging.WARNING value
-
-
-
-        def filter_alert(record: logging.LogRecord) -> bool:
-            ''' Filter to accept log records with level greater than or equal to warning level, otherwise ignore.
-
-            OUTPUT:
-            - (bool) = true to accept, false to ignore
-            '''
-            # Because child handlers do not check message level, do it here:
-            # See https://www.electricmonk.nl/log/2017/08/06/understanding-pythons-logging-module/
-            return record.levelno >= 30 # logging.WARNING value
-
-
-
         def filter_add_cntxt(record: logging.LogRecord) -> bool:
             ''' Filter to add contextual color character flag (cntxt_flag) to LogRecord (e.g. ⚪, ⬛, 🟧, 🟥, 🟥🟥)
 
             OUTPUT:
             - (bool) = true to accept all records
             '''
-            match record.levelname:
-                case 'DEBUG':
-                    record.cntxt_flag = '⚪'
-                case 'INFO':
-                    record.cntxt_flag = '⬛'
-                case 'WARNING':
-                    record.cntxt_flag = '🟧'
-                case 'ERROR':
-                    record.cntxt_flag = '🟥'
-                case 'CRITICAL':
-                    record.cntxt_flag = '🟥🟥'
-                case _:
-                    record.cntxt_flag = ''
-            
+            record.cntxt_flag = _CNTXT_FLAGS.get(record.levelno, '')
             return True # accept all records
 
 
 
         # ---------- LOGGING LEVEL ----------
         # Create logger instance for all log record messages.
+        # Use root logger, so records from any module logger (e.g. outside
+        # lib) propagate to its single queue handler; no further parents.
         # See https://docs.python.org/3/howto/logging.html#logging-flow
         #     https://docs.python.org/3/howto/logging.html#loggers
-        self._log = logging.getLogger() # Create logger instance.
-        self._log.setLevel(logging.DEBUG) # Set logger level ≥ debug level.
-        # No logger filter needed.
+        self._log = logging.getLogger() # Get root logger instance.
+        # Logger level set below, after handlers. No logger filter needed.
 
 
 
@@ -299,7 +335,6 @@ class Log:
             '%(threadName)s → %(processName)s \n'
             '%(pathname)s \n'
             '→ %(module)s → %(funcName)s @ %(lineno)d \n'
-            'EXCEPTION INFO: %(exc_info)s \n'
         )
         # For file, include contextual color flag.
         fmt_file_fyi = (
@@ -314,56 +349,70 @@ class Log:
             '%(threadName)s → %(processName)s \n'
             '%(pathname)s \n'
             '→ %(module)s → %(funcName)s @ %(lineno)d \n'
-            'EXCEPTION INFO: %(exc_info)s \n'
         )
 
         # Create formatters for handlers.
         # See https://docs.python.org/3/howto/logging.html#formatters
-        formatter_stderr_fyi = logging.Formatter(fmt_stderr_fyi, datefmt)
-        formatter_stderr_alert = logging.Formatter(fmt_stderr_alert, datefmt)
+        # Cache formatted time, shared by all formatters with same date format.
+        formatter_stderr_fyi = CachedTimeFormatter(fmt_stderr_fyi, datefmt)
+        formatter_stderr_alert = CachedTimeFormatter(fmt_stderr_alert, datefmt)
         
-        formatter_file_fyi = logging.Formatter(fmt_file_fyi, datefmt)
-        formatter_file_alert = logging.Formatter(fmt_file_alert, datefmt)
+        # For file, one handler formats fyi and alert messages by record level.
+        formatter_file = LevelFormatter({
+            logging.DEBUG: CachedTimeFormatter(fmt_file_fyi, datefmt),
+            logging.WARNING: CachedTimeFormatter(fmt_file_alert, datefmt),
+        })
 
 
 
         # ---------- HANDLERS ----------
+        # Handlers below run in a background listener thread, so logging
+        # calls only enqueue records.
+        # See https://docs.python.org/3/howto/logging-cookbook.html#dealing-with-handlers-that-block
+        handlers = []
+
         if filepathname == None: # Log all messages to stderr only.
-            # Create logger handler to stderr for fyi messages (e.g. debug and info).
+            # Create logger handler to stderr for all messages (e.g. debug, info, warning, error, and critical).
+            # One batched handler keeps fyi and alert messages in order.
             # See https://docs.python.org/3/library/logging.handlers.html
-            # See https://docs.python.org/3/library/logging.html#filter-objects
-            handler_stderr_fyi = logging.StreamHandler() # Create handler.
-            handler_stderr_fyi.setLevel(logging.DEBUG) # Set handler level ≥ debug level.
-            handler_stderr_fyi.addFilter(filter_fyi) # Add handler filter: < warning level (i.e. only debug and info).
-            handler_stderr_fyi.setFormatter(formatter_stderr_fyi) # Set handler formatter.
-            self._log.addHandler(handler_stderr_fyi) # Add handler to logger instance.
+            handler_stderr = BatchedStderrHandler() # Create handler: batch writes during bursts of messages.
+            handler_stderr.setLevel(logging.DEBUG) # Set handler level ≥ debug level.
+            handler_stderr.setFormatter(LevelFormatter({ # Set handler formatter: fyi or alert by record level.
+                logging.DEBUG: formatter_stderr_fyi,
+                logging.WARNING: formatter_stderr_alert,
+            }))
+            handlers.append(handler_stderr) # Add handler to listener.
             
         else: # Log all messages to logfile, plus alerts to stderr.
-            # Create logger handler to logfile for fyi messages (e.g. debug and info).
-            # See https://docs.python.org/3/library/logging.handlers.html
-            # See https://docs.python.org/3/library/logging.html#filter-objects
-            handler_file_fyi = logging.FileHandler(filepathname, mode='a', encoding='utf-8') # Create handler.
-            handler_file_fyi.setLevel(logging.DEBUG) # Set handler level.
-            handler_file_fyi.addFilter(filter_fyi) # Add handler filter: allow only fyi messages (e.g. debug and info).
-            handler_file_fyi.addFilter(filter_add_cntxt) # Add handler filter: add contextual color flag.
-            handler_file_fyi.setFormatter(formatter_file_fyi) # Set handler formatter.
-            self._log.addHandler(handler_file_fyi) # Add handler to logger instance.
-        
-            # Create logger handler to logfile for alert messages (e.g. warning, error, and critical).
+            # Create logger handler to logfile for all messages (e.g. debug, info, warning, error, and critical).
             # See https://docs.python.org/3/library/logging.handlers.html
             # See https://docs.python.org/3/library/logging.html#filter-objects
-            handler_file_alert = logging.FileHandler(filepathname, mode='a', encoding='utf-8') # Create handler.
-            handler_file_alert.setLevel(logging.WARNING) # Set handler level.
-            handler_file_alert.addFilter(filter_alert) # Add handler filter: allow only alert messages (e.g. warning, error, and critical).
-            handler_file_alert.addFilter(filter_add_cntxt) # Add handler filter: add contextual color flag.
-            handler_file_alert.setFormatter(formatter_file_alert) # Set handler formatter.
-            self._log.addHandler(handler_file_alert) # Add handler to logger instance.
+            handler_file = BufferedFileHandler(filepathname, mode='a', encoding='utf-8') # Create handler: buffer writes, flush alerts immediately.
+            handler_file.setLevel(logging.DEBUG) # Set handler level.
+            handler_file.addFilter(filter_add_cntxt) # Add handler filter: add contextual color flag.
+            handler_file.setFormatter(formatter_file) # Set handler formatter: fyi or alert by record level.
+            handlers.append(handler_file) # Add handler to listener.
         
-        # Create logger handler to stderr for alert messages (e.g. warning, error, and critical).
-        # See https://docs.python.org/3/library/logging.handlers.html
-        # See https://docs.python.org/3/library/logging.html#filter-objects
-        handler_stderr_alert = logging.StreamHandler() # Create handler.
-        handler_stderr_alert.setLevel(logging.WARNING) # Set handler level ≥ warning level.
-        handler_stderr_alert.addFilter(filter_alert) # Add handler filter: allow only alert messages (e.g. warning, error, and critical).
-        handler_stderr_alert.setFormatter(formatter_stderr_alert) # Set handler formatter.
-        self._log.addHandler(handler_stderr_alert) # Add handler to logger instance.
\ No newline at end of file
+            # Skip alerts to stderr when stderr is not a terminal (e.g.
+            # redirected to file or /dev/null), unless environment variable
+            # FORCE_STDERR_LOG is '1'.
+            if (sys.stderr is not None and not sys.stderr.closed and sys.stderr.isatty()) or os.environ.get('FORCE_STDERR_LOG') == '1':
+                # Create logger handler to stderr for alert messages (e.g. warning, error, and critical).
+                # See https://docs.python.org/3/library/logging.handlers.html
+                handler_stderr_alert = BatchedStderrHandler() # Create handler: batch writes during bursts of alerts.
+                handler_stderr_alert.setLevel(logging.WARNING) # Set handler level ≥ warning level.
+                handler_stderr_alert.setFormatter(formatter_stderr_alert) # Set handler formatter.
+                handlers.append(handler_stderr_alert) # Add handler to listener.
+
+        # Create queue handler, passing log records to listener handlers.
+        # See https://docs.python.org/3/library/logging.handlers.html#queuehandler
+        #     https://docs.python.org/3/library/logging.handlers.html#queuelistener
+        # Set logger level to lowest handler level, so records no handler
+        # accepts are dropped before a record is created.
+        self._log.setLevel(min(handler.level for handler in handlers))
+        log_queue = queue.SimpleQueue()
+        self._queue_handler = logging.handlers.QueueHandler(log_queue) # Create handler.
+        self._log.addHandler(self._queue_handler) # Add handler to logger instance.
+        self._listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self._listener.start()
+        atexit.register(self._listener.stop) # Write queued records, if not terminated.
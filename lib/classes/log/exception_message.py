@@ -5,12 +5,12 @@ commonly-used formatted message objects for more useful exception
 messages (e.g. warning, error, and critical).
 '''
 import logging # https://docs.python.org/3/library/logging.html
-log = logging.getLogger().getChild('lib.classes.log.exception_message')
+log = logging.getLogger(__name__)
 
 from dataclasses import dataclass # https://docs.python.org/3/library/dataclasses.html
 
 
-@dataclass
+@dataclass(slots=True)
 class ExceptionMessageFormatted:
     ''' General formatted message class for exceptions.
 
@@ -4,13 +4,12 @@ PURPOSE: Organize a variety of nested and subclass modules for
 commonly-used log execution information objects.
 '''
 import logging # https://docs.python.org/3/library/logging.html
-log = logging.getLogger().getChild('lib.classes.log.exec_info')
+log = logging.getLogger(__name__)
 
 from dataclasses import dataclass, field # https://docs.python.org/3/library/dataclasses.html
 
 import getpass # https://docs.python.org/3/library/getpass.html
 import os # https://docs.python.org/3/library/os.html
-import platform # https://docs.python.org/3/library/platform.html
 import sys  # https://docs.python.org/3/library/sys.html
 
 from lib.classes.log.exec_info.directories import _Directories
@@ -18,16 +17,18 @@ from lib.classes.log.exec_info.timestamps import _Timestamps
 
 
 
-@dataclass
+@dataclass(slots=True)
 class _ExecInfo:
     ''' Module execution information for log file. '''
     _module_basename: str = None
     _arguments: list[str] = field(default_factory=list)
     _directories: _Directories = field(default_factory=_Directories)
     _user: str = field(default_factory=getpass.getuser)
-    _system: platform.uname_result = field(default_factory=platform.uname)
-    _python_version: str = field(default_factory=platform.python_version)
+    _system: 'platform.uname_result' = None # Set on first _get_system call.
+    _python_version: str = field(default_factory=lambda: sys.version.split()[0])
     _timestamps: _Timestamps = field(default_factory=_Timestamps)
+    _cached_filepathname: str = field(default=None, repr=False)
+    _cached_module_filepathname: str = field(default=None, repr=False)
 
 
 
@@ -38,11 +39,12 @@ class _ExecInfo:
         self._directories.initial = os.path.dirname(_module_filepathname)
         self._module_basename = os.path.splitext(os.path.basename(_module_filepathname))[0]
         self._arguments = sys.argv[1:]
+        self._set_filepathnames()
 
 
 
-    def _get_filepathname(self) -> str:
-        ''' Return log file path and name as module basename plus execution timestamp (yyyymmddhhmmss) with log extension. '''
+    def _set_filepathnames(self) -> None:
+        ''' Cache log and module file path and name; call again after changing directories. '''
         if self._directories.final is None:
             dirpath = os.path.join(self._directories.initial, 'logs')
         else:
@@ -50,10 +52,27 @@ class _ExecInfo:
 
         basename_ext = self._module_basename + '_' + self._timestamps.start.strftime('%Y%m%d%H%M%S') + os.extsep + 'log'
 
-        return os.path.join(dirpath, basename_ext)
+        self._cached_filepathname = os.path.join(dirpath, basename_ext)
+        self._cached_module_filepathname = os.path.join(self._directories.initial, self._module_basename + os.extsep + 'py')
+
+
+
+    def _get_filepathname(self) -> str:
+        ''' Return log file path and name as module basename plus execution timestamp (yyyymmddhhmmss) with log extension. '''
+        return self._cached_filepathname
+
+
+
+    def _get_system(self) -> 'platform.uname_result':
+        ''' Return operating system information, querying it only once. '''
+        if self._system is None:
+            import platform # https://docs.python.org/3/library/platform.html
+            self._system = platform.uname()
+
+        return self._system
 
 
 
     def _get_module_filepathname(self) -> str:
         ''' Return module file path and name. '''
-        return os.path.join(self._directories.initial, self._module_basename + os.extsep + 'py')
\ No newline at end of file
+        return self._cached_module_filepathname
\ No newline at end of file
@@ -4,13 +4,13 @@ PURPOSE: Organize a variety of nested and subclass modules for
 commonly-used log execution directory information objects.
 '''
 import logging # https://docs.python.org/3/library/logging.html
-log = logging.getLogger().getChild('lib.classes.log.exec_info.directories')
+log = logging.getLogger(__name__)
 
 from dataclasses import dataclass # https://docs.python.org/3/library/dataclasses.html
 
 
 
-@dataclass
+@dataclass(slots=True)
 class _Directories:
     ''' Directories for log file. '''
     initial: str = None # Initial application log directory; i.e. \\logs.
@@ -4,40 +4,42 @@ PURPOSE: Organize a variety of nested and subclass modules for
 commonly-used log execution timpestamp information objects.
 '''
 import logging # https://docs.python.org/3/library/logging.html
-log = logging.getLogger().getChild('lib.classes.log.exec_info.timpestamps')
+log = logging.getLogger(__name__)
 
-from dataclasses import dataclass # https://docs.python.org/3/library/dataclasses.html
+from dataclasses import dataclass, field # https://docs.python.org/3/library/dataclasses.html
 
 import datetime # https://docs.python.org/3/library/datetime.html
 
 
 
-@dataclass
+@dataclass(slots=True)
 class _Timestamps:
     ''' UTC timestamps for module execution log information. '''
     start: datetime = None # UTC timestamp for the start of the module execution.
     end: datetime = None # UTC timestamp for the end of the module execution.
+    _start_iso: str = field(default=None, repr=False) # Cached ISO format of start.
+    _end_iso: str = field(default=None, repr=False) # Cached ISO format of end; see set_end.
 
     def __post_init__(self):
          # Set the start time to the current UTC time.
          self.start = datetime.datetime.now(datetime.UTC)
+         self._start_iso = self.start.isoformat()
 
 
 
-    def _get_elapsed(self) -> str:
-        ''' Get text message for elapsed time between start and end times. '''
-        included_seconds = 0
-        elapsed_seconds = (self.end - self.start).total_seconds()
+    def set_end(self, end: datetime.datetime) -> None:
+        ''' Set end time and its cached ISO format together. '''
+        self.end = end
+        self._end_iso = end.isoformat()
 
-        whole_minutes = int(elapsed_seconds // 60)
-        included_seconds += 60 * whole_minutes
 
-        whole_seconds = int(elapsed_seconds - included_seconds)
-        included_seconds += whole_seconds
 
-        whole_milliseconds = int((elapsed_seconds - included_seconds) * 1000)
-        included_seconds += whole_milliseconds / 1000
+    def _get_elapsed(self) -> str:
+        ''' Get text message for elapsed time between start and end times. '''
+        elapsed_microseconds = (self.end - self.start) // datetime.timedelta(microseconds=1)
 
-        whole_microseconds = int((elapsed_seconds - included_seconds) * 1000000)
+        whole_minutes, elapsed_microseconds = divmod(elapsed_microseconds, 60_000_000)
+        whole_seconds, elapsed_microseconds = divmod(elapsed_microseconds, 1_000_000)
+        whole_milliseconds, whole_microseconds = divmod(elapsed_microseconds, 1_000)
 
         return f'{whole_minutes:d}m {whole_seconds:d}s {whole_milliseconds:d}ms {whole_microseconds:d}μs'
\ No newline at end of file
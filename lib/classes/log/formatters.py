@@ -0,0 +1,61 @@
+''' Formatter related classes for Log class handlers.
+
+PURPOSE: Organize a variety of nested and subclass modules for
+commonly-used log record formatter objects.
+'''
+import logging # https://docs.python.org/3/library/logging.html
+log = logging.getLogger(__name__)
+
+import threading # https://docs.python.org/3/library/threading.html
+import time # https://docs.python.org/3/library/time.html
+
+
+
+class CachedTimeFormatter(logging.Formatter):
+    ''' Formatter reusing formatted record time for records created within the same second.
+
+    See: https://docs.python.org/3/library/logging.html#logging.Formatter.formatTime
+    '''
+    _cache = threading.local() # Last (second, date format, converter) key and formatted time, per thread.
+
+
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        ''' Return record creation time formatted by date format, formatting once per second. '''
+        cache = self._cache
+        key = (int(record.created), datefmt or self.default_time_format, self.converter)
+        if getattr(cache, 'key', None) != key:
+            cache.key = key
+            cache.text = time.strftime(key[1], self.converter(key[0]))
+
+        if datefmt or not self.default_msec_format:
+            return cache.text
+        else:
+            return self.default_msec_format % (cache.text, record.msecs)
+
+
+
+class LevelFormatter(logging.Formatter):
+    ''' Formatter dispatching each log record to a formatter selected by record level.
+
+    See: https://docs.python.org/3/library/logging.html#formatter-objects
+    '''
+    def __init__(self, formatters: dict[int, logging.Formatter]):
+        ''' Store formatters by minimum level.
+
+        INPUT:
+        - formatters (dict) = formatters keyed by minimum log level they apply to
+                              (e.g. {logging.DEBUG: fyi_formatter, logging.WARNING: alert_formatter})
+        '''
+        super().__init__()
+        self._formatters = sorted(formatters.items(), reverse=True) # Highest level first.
+
+
+
+    def format(self, record: logging.LogRecord) -> str:
+        ''' Return record formatted by formatter with highest minimum level ≤ record level. '''
+        for level, formatter in self._formatters:
+            if record.levelno >= level:
+                return formatter.format(record)
+
+        return self._formatters[-1][1].format(record) # Below all levels, use lowest level formatter.
@@ -0,0 +1,164 @@
+''' Handler related classes for Log class.
+
+PURPOSE: Organize a variety of nested and subclass modules for
+commonly-used log record handler objects.
+'''
+import logging # https://docs.python.org/3/library/logging.html
+log = logging.getLogger(__name__)
+
+import threading # https://docs.python.org/3/library/threading.html
+
+
+
+class _TimedFlushMixin:
+    ''' Handler mixin flushing buffered records after a delay, unless flushed sooner. '''
+    flush_interval: float = 0.5 # Maximum seconds records stay buffered.
+    _flush_timer: threading.Timer = None
+
+
+
+    def _schedule_flush(self) -> None:
+        ''' Start flush timer, if not already pending. '''
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+
+
+    def _cancel_flush(self) -> None:
+        ''' Cancel pending flush timer, if any. '''
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+
+
+class BufferedFileHandler(_TimedFlushMixin, logging.FileHandler):
+    ''' File handler batching writes in a large buffer, flushed on alert records or after a short interval.
+
+    See: https://docs.python.org/3/library/logging.handlers.html#filehandler
+         https://docs.python.org/3/library/functions.html#open
+    '''
+    def __init__(
+        self,
+        filename: str,
+        mode: str = 'a',
+        encoding: str | None = None,
+        delay: bool = False,
+        errors: str | None = None,
+        buffering: int = 65536,
+        flush_level: int = logging.WARNING,
+        flush_interval: float = 0.5,
+    ):
+        ''' Open log file with write buffer.
+
+        INPUT:
+        - filename, mode, encoding, delay, errors = see logging.FileHandler
+        - buffering (int)(optional) = file write buffer size in bytes
+        - flush_level (int)(optional) = minimum record level flushed immediately (e.g. logging.WARNING)
+        - flush_interval (float)(optional) = maximum seconds lower level records stay buffered
+        '''
+        self.buffering = buffering
+        self.flush_level = flush_level
+        self.flush_interval = flush_interval
+        super().__init__(filename, mode, encoding, delay, errors)
+
+
+
+    def _open(self):
+        ''' Open log file with write buffer size. '''
+        return open(self.baseFilename, self.mode, buffering=self.buffering, encoding=self.encoding, errors=self.errors)
+
+
+
+    def emit(self, record: logging.LogRecord) -> None:
+        ''' Write record to buffer, flushing alert records immediately and others by timer. '''
+        if self.stream is None:
+            if self.mode != 'w' or not self._closed:
+                self.stream = self._open()
+        if self.stream:
+            try:
+                self.stream.write(self.format(record) + self.terminator)
+                if record.levelno >= self.flush_level:
+                    self.flush()
+                else:
+                    self._schedule_flush()
+            except RecursionError: # See StreamHandler.emit
+                raise
+            except Exception:
+                self.handleError(record)
+
+
+
+    def flush(self) -> None:
+        ''' Cancel pending flush timer, then flush buffer to log file. '''
+        self.acquire()
+        try:
+            self._cancel_flush()
+            super().flush()
+        finally:
+            self.release()
+
+
+
+class BatchedStderrHandler(_TimedFlushMixin, logging.StreamHandler):
+    ''' Stream handler (default stderr) batching formatted records into fewer writes.
+
+    Records are written when the batch reaches batch_size characters or
+    after flush_interval seconds, whichever comes first.
+
+    See: https://docs.python.org/3/library/logging.handlers.html#streamhandler
+    '''
+    def __init__(self, stream=None, batch_size: int = 4096, flush_interval: float = 0.05):
+        ''' Create empty batch for stream.
+
+        INPUT:
+        - stream (optional) = see logging.StreamHandler; default sys.stderr
+        - batch_size (int)(optional) = batch length in characters written immediately
+        - flush_interval (float)(optional) = maximum seconds records stay batched
+        '''
+        super().__init__(stream)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._batch = []
+        self._batch_length = 0
+
+
+
+    def emit(self, record: logging.LogRecord) -> None:
+        ''' Add record to batch, writing batch when full or by timer. '''
+        try:
+            msg = self.format(record) + self.terminator
+            self._batch.append(msg)
+            self._batch_length += len(msg)
+            if self._batch_length >= self.batch_size:
+                self.flush()
+            else:
+                self._schedule_flush()
+        except RecursionError: # See StreamHandler.emit
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+
+    def flush(self) -> None:
+        ''' Cancel pending flush timer, then write batch and flush stream. '''
+        self.acquire()
+        try:
+            self._cancel_flush()
+            if self._batch:
+                self.stream.write(''.join(self._batch))
+                self._batch.clear()
+                self._batch_length = 0
+            super().flush()
+        finally:
+            self.release()
+
+
+
+    def close(self) -> None:
+        ''' Write remaining batch, then close handler. '''
+        self.flush()
+        super().close()
@@ -6,16 +6,48 @@ related object classes for quicker and easier informational and
 debugging messages.
 '''
 import logging # https://docs.python.org/3/library/logging.html
-log = logging.getLogger().getChild('lib.classes.log.variable_value_message')
+log = logging.getLogger(__name__)
 
 import pprint # https://docs.python.org/3/library/pprint.html
 pp = pprint.PrettyPrinter(indent=4, width=160, compact=False,sort_dicts=False)
 
 from typing import Any # https://docs.python.org/3/library/typing.html
 
-def get(name: str, value: Any) -> str:
+# Value types listed inline; others pretty-printed on following lines.
+_SCALAR_TYPES = (str, int, float, bool) # Exact types, checked first without isinstance.
+_INLINE_TYPES = (bool, bytes, int, float, str, list, tuple, type(None))
+
+
+
+class _Lazy:
+    ''' Variable name and value, formatted only when converted to string (e.g. when log record is emitted). '''
+    __slots__ = ('name', 'value')
+
+
+
+    def __init__(self, name: str, value: Any):
+        ''' Store variable name and value, unformatted. '''
+        self.name = name
+        self.value = value
+
+
+
+    def __str__(self) -> str:
+        ''' Return formatted variable name and value; pformat runs on first string conversion (by QueueHandler, on caller thread). '''
+        return _format(self.name, self.value)
+
+
+
+def get(name: str, value: Any) -> _Lazy:
+    ''' Return variable name and value for print or logging, formatted only when converted to string. '''
+    return _Lazy(name, value)
+
+
+
+def _format(name: str, value: Any) -> str:
     ''' Format variable name and value for print or logging, especially for info and debug messages. '''
-    if isinstance(value, (bool, bytes, int, float, str, list, tuple, type(None))):
-        return f'🔎VarVal🔍 {name} ({type(value)}): {value}'
+    value_type = type(value)
+    if value_type in _SCALAR_TYPES or isinstance(value, _INLINE_TYPES):
+        return f'🔎VarVal🔍 {name} ({value_type}): {value}'
     else:
-        return f'🔎VarVal🔍 {name} ({type(value)}):\n{pp.pformat(value)}'
\ No newline at end of file
+        return f'🔎VarVal🔍 {name} ({value_type}):\n{pp.pformat(value)}'